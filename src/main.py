@@ -17,6 +17,13 @@ Usage:
     # Enable debug logging
     python -m main --debug
 
+    # Enable debug logging for selected loggers only
+    DEBUG_LOGGERS=react_agent,httpx python -m main --debug
+
+    # Preload .env in the parent shell so every (re)started process sees it;
+    # --no-override keeps variables already exported in the shell
+    python -m dotenv run --no-override -- python -m main --dev
+
 Endpoints:
     - /langgraph/health  - Health check
     - /langgraph/call    - LangGraph chat endpoint
@@ -30,10 +37,30 @@ Endpoints:
 # This ensures Langfuse and other SDKs pick up the env vars during initialization
 from dotenv import load_dotenv
 
-load_dotenv()
+_DOTENV_LOADED = False
+
+
+def _ensure_env() -> None:
+    """Load the .env file once; later calls are no-ops.
+
+    Variables already present in the environment (e.g. preloaded with
+    ``python -m dotenv run --no-override``) take precedence over values in the file.
+    """
+    global _DOTENV_LOADED
+    if not _DOTENV_LOADED:
+        load_dotenv(override=False)
+        _DOTENV_LOADED = True
+
+
+_ensure_env()
 
 import argparse  # noqa: E402
+import atexit  # noqa: E402
+import importlib.util  # noqa: E402
 import logging  # noqa: E402
+import logging.handlers  # noqa: E402
+import os  # noqa: E402
+import queue  # noqa: E402
 
 from orcakit_sdk.runner.agent import Agent  # noqa: E402
 
@@ -46,6 +73,37 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_log_listener: logging.handlers.QueueListener | None = None
+
+
+def configure_queue_logging() -> None:
+    """Move the root logger's handlers behind a queue.
+
+    Log calls only enqueue the record; a background QueueListener thread does
+    the actual stream I/O, so coroutines never block on handler locks or writes.
+    Calling this again is a no-op.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return
+
+    root = logging.getLogger()
+    handlers = list(root.handlers)
+    for handler in handlers:
+        root.removeHandler(handler)
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    _log_listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _log_listener.start()
+    # Flush records still in the queue on interpreter shutdown
+    atexit.register(_log_listener.stop)
+
+
+configure_queue_logging()
+
 
 def parse_args() -> argparse.Namespace:
     """Parse command line arguments.
@@ -116,48 +174,58 @@ Endpoints:
     parser.add_argument(
         "--debug",
         action="store_true",
-        help="Enable debug logging",
+        help="Enable debug logging for the loggers in DEBUG_LOGGERS (default: react_agent)",
     )
 
     return parser.parse_args()
 
 
-def configure_debug_mode() -> None:
-    """Configure debug mode settings.
+def configure_debug_mode() -> list[str]:
+    """Configure debug mode settings and return the loggers set to DEBUG.
 
-    Enables verbose logging for various components including:
-    - LangChain/LangGraph internals
-    - HTTP requests and responses
-    - Tool execution details
+    Enables DEBUG logging only for the loggers listed in the comma-separated
+    DEBUG_LOGGERS environment variable (default: "react_agent"), e.g.
+    "react_agent,httpx" or "react_agent,langchain,langgraph,uvicorn".
+    LangChain's global debug/verbose output is turned on only when
+    "langchain" is one of the targets, and uvicorn's own loggers only when a
+    "uvicorn" logger is.
     """
-    # Set all loggers to DEBUG
-    logging.getLogger().setLevel(logging.DEBUG)
-    logging.getLogger("react_agent").setLevel(logging.DEBUG)
-    logging.getLogger("langchain").setLevel(logging.DEBUG)
-    logging.getLogger("langgraph").setLevel(logging.DEBUG)
-    logging.getLogger("httpx").setLevel(logging.DEBUG)
-    logging.getLogger("uvicorn").setLevel(logging.DEBUG)
+    # Handlers sit behind the queue, so only levels need to change here
+    configure_queue_logging()
+
+    targets = [
+        name.strip()
+        for name in os.environ.get("DEBUG_LOGGERS", "react_agent").split(",")
+        if name.strip()
+    ]
+    for name in targets:
+        logging.getLogger(name).setLevel(logging.DEBUG)
 
     # Enable LangChain debug mode
-    try:
-        from langchain.globals import set_debug, set_verbose
+    if "langchain" in targets:
+        try:
+            from langchain.globals import set_debug, set_verbose
 
-        set_debug(True)
-        set_verbose(True)
-    except ImportError:
-        pass
+            set_debug(True)
+            set_verbose(True)
+        except ImportError:
+            pass
 
-    logger.debug("Debug mode enabled")
+    logger.info("Debug logging enabled for: %s", ", ".join(targets))
+    return targets
 
 
 def main() -> None:
     """Run the ReAct Agent HTTP server."""
     args = parse_args()
 
-    # Configure logging level
-    log_level = "debug" if args.debug else "info"
+    # Configure logging level; uvicorn applies log_level to all of its loggers,
+    # so it only gets "debug" when uvicorn is one of the DEBUG_LOGGERS targets
+    log_level = "info"
     if args.debug:
-        configure_debug_mode()
+        targets = configure_debug_mode()
+        if any(name == "uvicorn" or name.startswith("uvicorn.") for name in targets):
+            log_level = "debug"
 
     # Dev mode: --dev or --reload enables hot reload
     dev_mode = args.dev or args.reload
@@ -167,18 +235,31 @@ def main() -> None:
             f"Starting ReAct Agent HTTP server in DEV mode on {args.host}:{args.port}"
         )
         logger.info("Hot reload enabled - file changes will trigger automatic reload")
+        # uvicorn only uses filesystem events when watchfiles is importable;
+        # otherwise it stat()s every watched file in a busy polling loop.
+        if importlib.util.find_spec("watchfiles") is None:
+            logger.warning(
+                "watchfiles is not installed; falling back to polling reloader"
+            )
     else:
         logger.info(f"Starting ReAct Agent HTTP server on {args.host}:{args.port}")
 
     logger.info("API Documentation available at /docs")
 
+    # uvicorn's "auto" loop runs on uvloop whenever it is importable
+    if importlib.util.find_spec("uvloop") is None:
+        logger.info("uvloop is not installed; using the default asyncio event loop")
+
     # Create Agent from the compiled graph and run HTTP server
     agent = Agent(graph=graph, name="ReAct Agent")
+    # Dev mode re-imports the graph in the reloaded worker, watching src/ only
+    dev_kwargs = {"graph_module": "react_agent.graph"} if dev_mode else {}
     agent.run(
         host=args.host,
         port=args.port,
         dev=dev_mode,
         log_level=log_level,
+        **dev_kwargs,
     )
 
 
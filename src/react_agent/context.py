@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass, field
-from typing import Annotated
+import functools
+import os
+from dataclasses import dataclass, field, fields
+from typing import Annotated, Any, Callable, TypeVar
 
+import orjson
 from langgraph.runtime import Runtime
 from orcakit_sdk.context import EnvAwareConfig
 
@@ -19,6 +21,10 @@ def get_context(runtime: Runtime[Context] | None) -> Context:
     Handles the case where runtime.context is a dict (e.g., when passed via with_config)
     by converting it to a Context object.
 
+    Contexts built here are cached and shared between calls, so they must not be
+    mutated. Call `Context.reload()` after changing environment variables at
+    runtime.
+
     Args:
         runtime: The runtime object containing context, or None.
 
@@ -26,28 +32,70 @@ def get_context(runtime: Runtime[Context] | None) -> Context:
         Context: The context from runtime, or a new default Context instance.
     """
     if runtime is None or runtime.context is None:
-        return Context()
+        return _default_context()
 
     ctx = runtime.context
     # Handle case where context is a dict (from with_config configurable)
     if isinstance(ctx, dict):
         # Filter only known Context fields to avoid unexpected kwargs
-        context_fields = {
-            "system_prompt",
-            "model",
-            "max_search_results",
-            "tool_only",
-            "enable_web_search",
-            "mcp_server_configs",
-        }
-        filtered = {
-            k: v for k, v in ctx.items() if k in context_fields and v is not None
-        }
-        return Context(**filtered)
+        filtered = {k: v for k, v in ctx.items() if k in _FIELD_NAMES and v is not None}
+        try:
+            return _context_from_items(tuple(sorted(filtered.items())))
+        except TypeError:
+            # Unhashable values cannot be used as a cache key
+            return Context(**filtered)
 
     return ctx
 
 
+@functools.lru_cache(maxsize=1)
+def _default_context() -> Context:
+    return Context()
+
+
+@functools.lru_cache(maxsize=32)
+def _context_from_items(items: tuple[tuple[str, Any], ...]) -> Context:
+    return Context(**dict(items))
+
+
+@functools.lru_cache(maxsize=1)
+def _mcp_servers_json() -> str:
+    # orjson output is compact; this string is only ever parsed by the MCP adapter
+    return orjson.dumps(MCP_SERVERS).decode()
+
+
+def _mcp_default() -> str:
+    """Return MCP_SERVER_CONFIGS from the env, else the bundled MCP servers."""
+    env_value = os.environ.get("MCP_SERVER_CONFIGS")
+    return env_value if env_value is not None else _mcp_servers_json()
+
+
+_T = TypeVar("_T", str, int, bool)
+
+_TRUE_VALUES = frozenset({"true", "1", "yes", "on"})
+
+
+def _parse_bool(value: str) -> bool:
+    return value.lower() in _TRUE_VALUES
+
+
+def _env_default(name: str, default: _T) -> Callable[[], _T]:
+    """Return a default factory reading env var `name`, else `default`.
+
+    The converter is picked once from the default's type, so building a
+    Context does no type reflection.
+    """
+    convert: Callable[[str], Any] = (
+        _parse_bool if isinstance(default, bool) else type(default)
+    )
+
+    def factory() -> _T:
+        env_value = os.environ.get(name)
+        return default if env_value is None else convert(env_value)
+
+    return factory
+
+
 @dataclass(kw_only=True)
 class Context(EnvAwareConfig):
     """Agent runtime configuration with environment variable support.
@@ -78,7 +126,7 @@ class Context(EnvAwareConfig):
     """
 
     system_prompt: str = field(
-        default=SYSTEM_PROMPT,
+        default_factory=_env_default("SYSTEM_PROMPT", SYSTEM_PROMPT),
         metadata={
             "description": (
                 "The system prompt to use for the agent's interactions. "
@@ -88,7 +136,7 @@ class Context(EnvAwareConfig):
     )
 
     model: Annotated[str, {"__template_metadata__": {"kind": "llm"}}] = field(
-        default="compatible_openai/DeepSeek-V3-0324",
+        default_factory=_env_default("MODEL", "compatible_openai/DeepSeek-V3-0324"),
         metadata={
             "description": (
                 "The name of the language model to use for the agent's main interactions. "
@@ -98,14 +146,14 @@ class Context(EnvAwareConfig):
     )
 
     max_search_results: int = field(
-        default=10,
+        default_factory=_env_default("MAX_SEARCH_RESULTS", 10),
         metadata={
             "description": "The maximum number of search results to return for each search query."
         },
     )
 
     tool_only: bool = field(
-        default=False,
+        default_factory=_env_default("TOOL_ONLY", False),
         metadata={
             "description": (
                 "Whether the agent should rely completely on tools for answering questions. "
@@ -114,8 +162,19 @@ class Context(EnvAwareConfig):
         },
     )
 
+    skip_matcher: bool = field(
+        default_factory=_env_default("SKIP_MATCHER", True),
+        metadata={
+            "description": (
+                "Whether to skip the separate tool-matching LLM call and bind all tools "
+                "to the main model, letting it choose tools itself. "
+                "Tool matching always runs when tool_only is True."
+            ),
+        },
+    )
+
     enable_web_search: bool = field(
-        default=True,
+        default_factory=_env_default("ENABLE_WEB_SEARCH", True),
         metadata={
             "description": (
                 "Whether to enable web search functionality. "
@@ -125,7 +184,7 @@ class Context(EnvAwareConfig):
     )
 
     mcp_server_configs: str = field(
-        default=json.dumps(MCP_SERVERS, indent=2),
+        default_factory=_mcp_default,
         metadata={
             "description": (
                 "JSON string containing MCP server configurations. "
@@ -133,3 +192,12 @@ class Context(EnvAwareConfig):
             ),
         },
     )
+
+    @staticmethod
+    def reload() -> None:
+        """Drop contexts cached by `get_context` so env changes take effect."""
+        _default_context.cache_clear()
+        _context_from_items.cache_clear()
+
+
+_FIELD_NAMES = frozenset(f.name for f in fields(Context))
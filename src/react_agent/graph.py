@@ -1,13 +1,17 @@
 """ReAct agent with intelligent tool matching."""
 
+import functools
 import logging
+import string
+from collections.abc import Callable, Sequence
 from datetime import UTC, datetime
-from typing import Literal, cast
+from typing import TYPE_CHECKING, Literal, cast
 
-from langchain_core.messages import AIMessage, ToolMessage
+from langchain_core.language_models import BaseChatModel, LanguageModelInput
+from langchain_core.messages import AIMessage, AnyMessage, ToolMessage
+from langchain_core.runnables import Runnable
 from langgraph.graph import END, START, StateGraph
 from langgraph.graph.state import RunnableConfig
-from langgraph.prebuilt import ToolNode
 from langgraph.runtime import Runtime
 from orcakit_sdk.utils import get_message_text, load_chat_model
 from pydantic import BaseModel, Field
@@ -15,14 +19,109 @@ from pydantic import BaseModel, Field
 from react_agent.context import Context, get_context
 from react_agent.prompts import REFUSAL_RESPONSE_PROMPT, TOOL_MATCHING_PROMPT
 from react_agent.state import InputState, State
-from react_agent.tools import get_tools
+from react_agent.tools import ToolCatalog, get_tool_catalog, tool_name
+
+if TYPE_CHECKING:
+    from langgraph.prebuilt import ToolNode
 
 logger = logging.getLogger(__name__)
 
 
-def _find_last_human_message(messages):
+@functools.lru_cache(maxsize=16)
+def _get_model(model_name: str) -> BaseChatModel:
+    """Load a chat model once per name and reuse its provider client."""
+    return cast(BaseChatModel, load_chat_model(model_name))
+
+
+def _get_model_with_tools(
+    model_name: str, catalog: ToolCatalog, tool_names: Sequence[str] | None
+) -> Runnable[LanguageModelInput, AIMessage]:
+    """Return the named model bound to the selected catalog tools.
+
+    Bindings are memoized on the catalog, keyed by the tool names as given, so
+    they are reused until the tools are reloaded. `tool_matcher` stores its
+    matches sorted and de-duplicated, so equal selections share one binding.
+    `None` selects every tool.
+    """
+    names = None if tool_names is None else tuple(tool_names)
+    key = ("bound_model", model_name, names)
+    model = catalog.derived.get(key)
+    if model is None:
+        if names is None:
+            tools = catalog.tools
+        else:
+            selected = frozenset(names)
+            tools = [tool for tool in catalog.tools if tool_name(tool) in selected]
+        model = _get_model(model_name).bind_tools(tools)
+        catalog.derived[key] = model
+    return cast(Runnable[LanguageModelInput, AIMessage], model)
+
+
+_TIME_FIELDS = frozenset({"system_time", "current_time"})
+
+
+@functools.lru_cache(maxsize=8)
+def _compile_system_prompt(system_prompt: str) -> Callable[[str], str]:
+    """Parse a system prompt once into a function filling in the current time.
+
+    Prompts whose only fields are plain `{system_time}`/`{current_time}` become a
+    single `str.join` over the pre-split literal text; anything else falls back
+    to `str.format`, so its semantics and errors are unchanged.
+    """
+    literals: list[str] = []
+    pending = ""
+    for literal, field_name, format_spec, conversion in string.Formatter().parse(
+        system_prompt
+    ):
+        pending += literal
+        if field_name is None:
+            continue
+        if field_name not in _TIME_FIELDS or format_spec or conversion:
+            return lambda now: system_prompt.format(system_time=now, current_time=now)
+        literals.append(pending)
+        pending = ""
+    literals.append(pending)
+    return lambda now: now.join(literals)
+
+
+def _get_tool_node(catalog: ToolCatalog) -> "ToolNode":
+    """Return a ToolNode for the catalog's tools, built once per catalog."""
+    key = ("tool_node",)
+    tool_node = catalog.derived.get(key)
+    if tool_node is None:
+        # Deferred so runs that never call a tool skip importing langgraph.prebuilt
+        from langgraph.prebuilt import ToolNode
+
+        tool_node = ToolNode(catalog.tools, handle_tool_errors=True)
+        catalog.derived[key] = tool_node
+    return cast("ToolNode", tool_node)
+
+
+def _tool_only(config: RunnableConfig, runtime: Runtime[Context]) -> bool:
+    """Resolve `tool_only`, building the context only if it is not configured."""
+    tool_only = config.get("configurable", {}).get("tool_only")
+    if tool_only is None:
+        return get_context(runtime).tool_only
+    return bool(tool_only)
+
+
+def _uses_tool_matcher(config: RunnableConfig, runtime: Runtime[Context]) -> bool:
+    """Return whether this run selects tools with `tool_matcher` first.
+
+    Tool-only mode needs the matcher to decide whether to refuse; otherwise it
+    is skipped unless `skip_matcher` is disabled, saving one LLM round-trip.
+    """
+    if _tool_only(config, runtime):
+        return True
+    skip_matcher = config.get("configurable", {}).get("skip_matcher")
+    if skip_matcher is None:
+        skip_matcher = get_context(runtime).skip_matcher
+    return not skip_matcher
+
+
+def _find_last_human_message(messages: Sequence[AnyMessage]) -> AnyMessage | None:
     for msg in reversed(messages):
-        if hasattr(msg, "type") and msg.type == "human":
+        if getattr(msg, "type", None) == "human":
             return msg
     return None
 
@@ -38,27 +137,19 @@ async def tool_matcher(
     if latest_human_message is None:
         return {"match_tools": []}
 
-    available_tools = await get_tools(config)
-    tool_info = [
-        (
-            getattr(tool, "name", getattr(tool, "__name__", str(tool))),
-            getattr(tool, "description", "") or getattr(tool, "__doc__", "") or "",
-        )
-        for tool in available_tools
-    ]
-
-    if not tool_info:
-        return {"match_tools": []}
-
     class ToolSelection(BaseModel):
         match_tools: list[str] = Field(
             description="List of tool names relevant to the user's query"
         )
 
     user_text = get_message_text(latest_human_message)
-    tools_description = "\n".join([f"- {name}: {desc}" for name, desc in tool_info])
+
+    catalog = await get_tool_catalog(config)
+    if not catalog.tools:
+        return {"match_tools": []}
+
     tool_selection_prompt = TOOL_MATCHING_PROMPT.format(
-        user_text=user_text, tools_description=tools_description
+        user_text=user_text, tools_description=catalog.description
     )
 
     try:
@@ -66,93 +157,74 @@ async def tool_matcher(
             config.get("configurable", {}).get("model", "")
             or get_context(runtime).model
         )
-        model = load_chat_model(model_name)
+        model = _get_model(model_name)
         structured_model = model.with_structured_output(ToolSelection)
-        response = await structured_model.ainvoke(
-            [{"role": "user", "content": tool_selection_prompt}]
+        response = cast(
+            ToolSelection,
+            await structured_model.ainvoke(
+                [{"role": "user", "content": tool_selection_prompt}]
+            ),
         )
 
-        available_tool_names = {name for name, _ in tool_info}
-        validated_tools = [
-            tool for tool in response.match_tools if tool in available_tool_names
-        ]
-        return (
-            {"match_tools": validated_tools} if validated_tools else {"match_tools": []}
-        )
+        # Normalize once here so call_model can use the list as a cache key
+        validated_tools = sorted(catalog.names.intersection(response.match_tools))
+        return {"match_tools": validated_tools}
 
     except Exception as e:
         logger.warning("Tool matching failed: %s", e)
-        return {"match_tools": [name for name, _ in tool_info]}
+        return {"match_tools": sorted(catalog.names)}
 
 
 async def refuse_answer(
     state: State, config: RunnableConfig, runtime: Runtime[Context]
 ) -> dict[str, list[AIMessage]]:
     """Generate refusal message when no appropriate tools are available."""
-    available_tools = await get_tools(config)
-    tool_names = [
-        getattr(tool, "name", getattr(tool, "__name__", str(tool)))
-        for tool in available_tools
-    ]
-    tool_descriptions = [getattr(tool, "description", "") for tool in available_tools]
-    capability_info = "\n".join(
-        [f"- {name}: {desc}" for name, desc in zip(tool_names, tool_descriptions)]
-    )
-
     user_question = ""
     latest_human_message = _find_last_human_message(state.messages)
     if latest_human_message:
         user_question = get_message_text(latest_human_message)
 
-    refusal_prompt = REFUSAL_RESPONSE_PROMPT.format(
-        user_question=user_question, capability_info=capability_info
-    )
-
     model_name = (
         config.get("configurable", {}).get("model", "") or get_context(runtime).model
     )
-    model = load_chat_model(model_name)
+    model = _get_model(model_name)
+
+    catalog = await get_tool_catalog(config)
+    refusal_prompt = REFUSAL_RESPONSE_PROMPT.format(
+        user_question=user_question, capability_info=catalog.description
+    )
     response = await model.ainvoke([{"role": "user", "content": refusal_prompt}])
 
-    return {"messages": [cast(AIMessage, response)]}
+    return {"messages": [response]}
 
 
 async def call_model(
     state: State, config: RunnableConfig, runtime: Runtime[Context]
 ) -> dict[str, list[AIMessage]]:
     """Execute LLM call with filtered tools."""
-    available_tools = await get_tools(config)
-
-    if state.match_tools:
-        matched_tool_names = set(state.match_tools)
-        filtered_tools = [
-            tool
-            for tool in available_tools
-            if getattr(tool, "name", getattr(tool, "__name__", str(tool)))
-            in matched_tool_names
-        ]
-    else:
-        filtered_tools = available_tools
+    # Ignore matches left in the state by earlier turns when the matcher is off
+    matched_tool_names = (
+        state.match_tools
+        if state.match_tools and _uses_tool_matcher(config, runtime)
+        else None
+    )
 
     model_name = (
         config.get("configurable", {}).get("model", "") or get_context(runtime).model
     )
-    model = load_chat_model(model_name).bind_tools(filtered_tools)
-
     system_prompt = (
         config.get("configurable", {}).get("system_prompt", "")
         or get_context(runtime).system_prompt
     )
-    current_time = datetime.now(tz=UTC).isoformat()
-    system_message = system_prompt.format(
-        system_time=current_time, current_time=current_time
+    system_message = _compile_system_prompt(system_prompt)(
+        datetime.now(tz=UTC).isoformat()
     )
 
-    response = cast(
-        AIMessage,
-        await model.ainvoke(
-            [{"role": "system", "content": system_message}, *state.messages]
-        ),
+    catalog = await get_tool_catalog(config)
+    model = _get_model_with_tools(model_name, catalog, matched_tool_names)
+
+    response = await model.ainvoke(
+        [{"role": "system", "content": system_message}, *state.messages]
     )
 
     if state.is_last_step and response.tool_calls:
@@ -172,8 +244,7 @@ async def dynamic_tools_node(
     state: State, config: RunnableConfig, runtime: Runtime[Context]
 ) -> dict[str, list[ToolMessage]]:
     """Execute tool calls from the last AI message."""
-    available_tools = await get_tools(config)
-    tool_node = ToolNode(available_tools, handle_tool_errors=True)
+    tool_node = _get_tool_node(await get_tool_catalog(config))
     result = await tool_node.ainvoke(state)
     return cast(dict[str, list[ToolMessage]], result)
 
@@ -187,16 +258,19 @@ def create_graph(name: str | None = None):
     builder.add_node("call_model", call_model)
     builder.add_node("tools", dynamic_tools_node)
 
-    builder.add_edge(START, "tool_matcher")
+    def route_start(
+        state: State, config: RunnableConfig, runtime: Runtime[Context]
+    ) -> Literal["tool_matcher", "call_model"]:
+        if _uses_tool_matcher(config, runtime):
+            return "tool_matcher"
+        return "call_model"
+
+    builder.add_conditional_edges(START, route_start)
 
     def route_tool_only_check(
         state: State, config: RunnableConfig, runtime: Runtime[Context]
     ) -> Literal["refuse_answer", "call_model"]:
-        configurable = config.get("configurable", {})
-        tool_only = (
-            configurable.get("tool_only") or get_context(runtime).tool_only or False
-        )
-        if tool_only and not state.match_tools:
+        if not state.match_tools and _tool_only(config, runtime):
             return "refuse_answer"
         return "call_model"
 
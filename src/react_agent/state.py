@@ -57,7 +57,8 @@ class State(InputState):
     """
     list of strings representing tool names that have been matched/selected during execution.
     
-    Each string contains the name of a tool that was matched.
+    Each string contains the name of a tool that was matched. `tool_matcher` stores
+    the names sorted and without duplicates.
     """
 
     # Additional attributes can be added here as needed.
@@ -1,54 +1,238 @@
 """Web scraping and search functionality tools."""
 
+from __future__ import annotations
+
+import asyncio
+import functools
 import logging
-from typing import Callable, cast
+import time
+from typing import TYPE_CHECKING, Callable, NamedTuple, cast
 
-from langchain_tavily import TavilySearch
+import orjson
 from langgraph.graph.state import RunnableConfig
 from langgraph.runtime import get_runtime
-from orcakit_sdk.mcp_adapter import get_mcp_tools
+from orcakit_sdk.mcp_adapter import clear_mcp_cache, get_mcp_tools
 
 from react_agent.context import Context, get_context
 
+if TYPE_CHECKING:
+    from langchain_tavily import TavilySearch
+
 logger = logging.getLogger(__name__)
 
+# Seconds a resolved tool catalog is reused. Expired entries are dropped together
+# with the MCP adapter's own per-config cache, so MCP servers are really queried
+# again and configurations no longer in use do not pin their tools.
+TOOLS_CACHE_TTL = 60.0
+
+# Cache of in-flight or resolved tool catalogs keyed by (mcp_server_configs,
+# enable_web_search). Each entry stores its expiry time alongside a future so
+# concurrent callers for the same configuration share a single MCP fetch.
+# Dict configs are keyed by their sorted JSON serialization.
+_TOOLS_CACHE: dict[
+    tuple[str, bool],
+    tuple[float, asyncio.Future[ToolCatalog]],
+] = {}
+
+
+class ToolCatalog(NamedTuple):
+    """Available tools together with metadata derived from them once."""
+
+    tools: list[Callable[..., object]]
+    """The tools themselves, in load order."""
+
+    names: frozenset[str]
+    """Names of all tools, for membership checks."""
+
+    name_desc_pairs: tuple[tuple[str, str], ...]
+    """(name, description) pairs in the same order as `tools`."""
+
+    description: str
+    """Rendered `- name: description` lines used in prompts."""
+
+    derived: dict[tuple[object, ...], object]
+    """Memo for objects built from these tools, such as models with tools bound.
+
+    Entries live exactly as long as the catalog, so they are rebuilt whenever the
+    tools are reloaded.
+    """
+
+    @classmethod
+    def from_tools(cls, tools: list[Callable[..., object]]) -> ToolCatalog:
+        """Build a catalog, rendering tool names and descriptions once."""
+        pairs = tuple((tool_name(tool), tool_description(tool)) for tool in tools)
+        return cls(
+            tools=tools,
+            names=frozenset(name for name, _ in pairs),
+            name_desc_pairs=pairs,
+            description="\n".join(f"- {name}: {desc}" for name, desc in pairs),
+            derived={},
+        )
+
+
+def tool_name(tool: object) -> str:
+    """Return the name used to identify a tool."""
+    return cast(str, getattr(tool, "name", getattr(tool, "__name__", str(tool))))
+
+
+def tool_description(tool: object) -> str:
+    """Return a tool's description, falling back to its docstring."""
+    return cast(
+        str, getattr(tool, "description", "") or getattr(tool, "__doc__", "") or ""
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _tavily(max_results: int, include_domains: tuple[str, ...] | None) -> TavilySearch:
+    """Return a shared TavilySearch so it is not rebuilt for every search.
+
+    This only saves constructing the tool and its API wrapper; the wrapper still
+    opens a new aiohttp session, and so new connections, for each search.
+    """
+    # Deferred so configurations without web search never import Tavily
+    from langchain_tavily import TavilySearch
+
+    kwargs: dict[str, object] = {"max_results": max_results}
+    if include_domains:
+        kwargs["include_domains"] = list(include_domains)
+    return TavilySearch(**kwargs)
+
 
 async def web_search(query: str, config: RunnableConfig) -> dict[str, object] | None:
     """Search for general web results using Tavily search engine."""
-    ctx = get_context(get_runtime(Context))
     max_search_results = (
         config.get("configurable", {}).get("max_search_results", None)
-        or ctx.max_search_results
+        or get_context(get_runtime(Context)).max_search_results
     )
     include_domains = config.get("configurable", {}).get("include_domains", None)
+    if isinstance(include_domains, str):
+        # A bare domain would otherwise be split into single characters
+        include_domains = [include_domains]
 
-    kwargs = {"max_results": max_search_results}
-    if include_domains:
-        kwargs["include_domains"] = include_domains
-
-    wrapped = TavilySearch(**kwargs)
+    wrapped = _tavily(
+        max_search_results, tuple(include_domains) if include_domains else None
+    )
     return cast(dict[str, object], await wrapped.ainvoke({"query": query}))
 
 
-async def get_tools(config: RunnableConfig) -> list[Callable[..., object]]:
-    """Get all available tools based on configuration."""
-    tools: list[Callable[..., object]] = []
-    ctx = get_context(get_runtime(Context))
+@functools.lru_cache(maxsize=4)
+def _parse_mcp(mcp_server_configs: str) -> dict[str, object] | None:
+    """Parse MCP server configs once per distinct JSON string.
 
-    enable_web_search = (
-        config.get("configurable", {}).get("enable_web_search", None)
-        or ctx.enable_web_search
-    )
+    Returns None for invalid JSON so the MCP adapter can report it as before.
+    The returned dict is shared and must not be mutated.
+    """
+    try:
+        parsed = orjson.loads(mcp_server_configs)
+    except orjson.JSONDecodeError:
+        return None
+    return parsed if isinstance(parsed, dict) else None
+
+
+def _mcp_configs_arg(mcp_server_configs: str) -> str | dict[str, object]:
+    """Return the parsed configs, or the raw string if it is not valid JSON."""
+    parsed_configs = _parse_mcp(mcp_server_configs)
+    return mcp_server_configs if parsed_configs is None else parsed_configs
+
+
+async def _load_tools(mcp_server_configs: str, enable_web_search: bool) -> ToolCatalog:
+    tools: list[Callable[..., object]] = []
     if enable_web_search:
         tools.append(web_search)
 
-    mcp_server_configs = (
-        config.get("configurable", {}).get("mcp_server_configs", None)
-        or ctx.mcp_server_configs
-    )
-    mcp_tools = await get_mcp_tools(mcp_server_configs)
+    mcp_tools = await get_mcp_tools(_mcp_configs_arg(mcp_server_configs))
     tools.extend(mcp_tools)
 
     logger.info("Loaded %d tools", len(tools))
 
-    return tools
+    return ToolCatalog.from_tools(tools)
+
+
+def _mcp_fetch_failed(key: tuple[str, bool], catalog: ToolCatalog) -> bool:
+    """Return whether MCP servers are configured but none of their tools loaded.
+
+    The MCP adapter logs and returns an empty list on any error instead of
+    raising, so this is the only sign that the fetch failed.
+    """
+    mcp_tool_count = len(catalog.tools) - int(key[1])
+    return mcp_tool_count == 0 and bool(_parse_mcp(key[0]))
+
+
+def _discard_failed(key: tuple[str, bool], task: asyncio.Future[ToolCatalog]) -> None:
+    # Calling exception() also marks it as retrieved for callers that went away.
+    if task.cancelled() or task.exception() is not None:
+        failed = True
+    else:
+        failed = _mcp_fetch_failed(key, task.result())
+        if failed:
+            logger.warning("No MCP tools loaded; not caching the tool catalog")
+    if failed:
+        cached = _TOOLS_CACHE.get(key)
+        if cached is not None and cached[1] is task:
+            del _TOOLS_CACHE[key]
+
+
+def _drop_expired(now: float) -> None:
+    """Remove expired catalogs and the MCP adapter's tools for their configs."""
+    for key, (expires_at, _) in list(_TOOLS_CACHE.items()):
+        if now >= expires_at:
+            del _TOOLS_CACHE[key]
+            # The adapter keeps tools per config for the whole process; drop
+            # them so a later reload reconnects instead of reusing the same list.
+            clear_mcp_cache(_mcp_configs_arg(key[0]))
+
+
+async def get_tool_catalog(config: RunnableConfig) -> ToolCatalog:
+    """Get all available tools and their metadata based on configuration.
+
+    Results are cached per configuration for `TOOLS_CACHE_TTL` seconds, so the
+    returned catalog is shared between callers and must not be mutated. A
+    catalog missing every MCP tool is not cached, so a failed MCP fetch is
+    retried on the next call.
+    """
+    configurable = config.get("configurable", {})
+    # Only resolve the context for settings the configurable does not provide
+    enable_web_search = configurable.get("enable_web_search")
+    if enable_web_search is None:
+        enable_web_search = get_context(get_runtime(Context)).enable_web_search
+    mcp_server_configs = (
+        configurable.get("mcp_server_configs")
+        or get_context(get_runtime(Context)).mcp_server_configs
+    )
+    if not isinstance(mcp_server_configs, str):
+        # Dicts are accepted by the MCP adapter but cannot be used as a cache key
+        mcp_server_configs = orjson.dumps(
+            mcp_server_configs, option=orjson.OPT_SORT_KEYS
+        ).decode()
+
+    key = (mcp_server_configs, bool(enable_web_search))
+    loop = asyncio.get_running_loop()
+    now = time.monotonic()
+
+    # Lookup and insertion happen without an intervening await, so concurrent
+    # coroutines cannot start duplicate fetches and no lock is needed.
+    cached = _TOOLS_CACHE.get(key)
+    if cached is None or now >= cached[0] or cached[1].get_loop() is not loop:
+        _drop_expired(now)
+        task = loop.create_task(_load_tools(*key))
+        task.add_done_callback(functools.partial(_discard_failed, key))
+        cached = (now + TOOLS_CACHE_TTL, task)
+        _TOOLS_CACHE[key] = cached
+
+    # Shield the shared fetch so one cancelled caller does not abort it for
+    # everyone else waiting on the same configuration.
+    return await asyncio.shield(cached[1])
+
+
+async def get_tools(config: RunnableConfig) -> list[Callable[..., object]]:
+    """Get all available tools based on configuration.
+
+    The returned list is shared through the tool cache and must not be mutated.
+    """
+    return (await get_tool_catalog(config)).tools
+
+
+def clear_tools_cache() -> None:
+    """Drop all cached tool catalogs and MCP tools so the next call reloads them."""
+    _TOOLS_CACHE.clear()
+    clear_mcp_cache()
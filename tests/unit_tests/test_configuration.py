@@ -1,6 +1,8 @@
 import os
 
-from react_agent.context import Context
+import pytest
+
+from react_agent.context import Context, get_context
 
 
 def test_context_init() -> None:
@@ -18,3 +20,27 @@ def test_context_init_with_env_vars_and_passed_values() -> None:
     os.environ["MODEL"] = "openai/gpt-4o-mini"
     context = Context(model="openai/gpt-5o-mini")
     assert context.model == "openai/gpt-5o-mini"
+
+
+def test_get_context_caches_default_until_reload() -> None:
+    context = get_context(None)
+    assert get_context(None) is context
+
+    Context.reload()
+    assert get_context(None) is not context
+
+
+def test_context_converts_env_var_types(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("TOOL_ONLY", "yes")
+    monkeypatch.setenv("MAX_SEARCH_RESULTS", "3")
+    context = Context()
+    assert context.tool_only is True
+    assert context.max_search_results == 3
+
+
+def test_explicit_default_value_beats_env_var(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("TOOL_ONLY", "true")
+    monkeypatch.setenv("MODEL", "env/model")
+    context = Context(tool_only=False, model="compatible_openai/DeepSeek-V3-0324")
+    assert context.tool_only is False
+    assert context.model == "compatible_openai/DeepSeek-V3-0324"
@@ -0,0 +1,125 @@
+import asyncio
+import importlib
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.tools import tool
+from pydantic import BaseModel
+
+from react_agent import tools
+from react_agent.context import Context
+from react_agent.graph import _compile_system_prompt
+from react_agent.prompts import SYSTEM_PROMPT
+from react_agent.state import State
+
+# `react_agent.graph` is shadowed by the compiled graph re-exported from the package
+graph_module = importlib.import_module("react_agent.graph")
+
+
+@tool
+def lookup(query: str) -> str:
+    """Look up a query in a fake MCP server."""
+    return query
+
+
+class FakeModel:
+    """Chat model stand-in recording which tools each call was bound to."""
+
+    def __init__(self, matches: list[str]) -> None:
+        self.matches = matches
+        self.bound: list[list[str]] = []
+
+    def bind_tools(self, bound_tools: list[Any]) -> "FakeModel":
+        self.bound.append(sorted(tools.tool_name(t) for t in bound_tools))
+        return self
+
+    def with_structured_output(self, schema: type[BaseModel]) -> Any:
+        matches = self.matches
+
+        class Structured:
+            async def ainvoke(self, messages: object) -> BaseModel:
+                return schema(match_tools=matches)
+
+        return Structured()
+
+    async def ainvoke(self, messages: object) -> AIMessage:
+        return AIMessage(content="done")
+
+
+@pytest.fixture
+def fake_model(monkeypatch: pytest.MonkeyPatch) -> Iterator[FakeModel]:
+    async def fake_get_mcp_tools(server_configs: object) -> list[object]:
+        return [lookup]
+
+    model = FakeModel(matches=["lookup"])
+    monkeypatch.setattr(tools, "get_runtime", lambda _: None)
+    monkeypatch.setattr(tools, "get_mcp_tools", fake_get_mcp_tools)
+    monkeypatch.setattr(graph_module, "_get_model", lambda _: model)
+    for name in ("TOOL_ONLY", "SKIP_MATCHER", "ENABLE_WEB_SEARCH"):
+        monkeypatch.delenv(name, raising=False)
+    Context.reload()
+    tools.clear_tools_cache()
+    yield model
+    tools.clear_tools_cache()
+    Context.reload()
+
+
+def run_nodes(configurable: dict[str, object]) -> list[str]:
+    async def run() -> list[str]:
+        nodes: list[str] = []
+        async for update in graph_module.graph.astream(
+            {"messages": [("user", "hello")]},
+            {"configurable": configurable},
+            stream_mode="updates",
+        ):
+            nodes.extend(update)
+        return nodes
+
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize(
+    "prompt",
+    [
+        SYSTEM_PROMPT,
+        "Now: {system_time} / {current_time}",
+        "{{literal}} costs $5 at {system_time}}}",
+        "{system_time:>30}",
+        "",
+    ],
+)
+def test_compile_system_prompt_matches_str_format(prompt: str) -> None:
+    now = "2024-01-01T00:00:00+00:00"
+    expected = prompt.format(system_time=now, current_time=now)
+    assert _compile_system_prompt(prompt)(now) == expected
+
+
+def test_compile_system_prompt_keeps_format_errors() -> None:
+    with pytest.raises(KeyError):
+        _compile_system_prompt("{unknown}")("now")
+
+
+def test_default_run_skips_matcher_and_binds_all_tools(fake_model: FakeModel) -> None:
+    assert run_nodes({}) == ["call_model"]
+    assert fake_model.bound == [["lookup", "web_search"]]
+
+
+def test_tool_only_without_matches_refuses(fake_model: FakeModel) -> None:
+    fake_model.matches = []
+    assert run_nodes({"tool_only": True}) == ["tool_matcher", "refuse_answer"]
+    assert fake_model.bound == []
+
+
+def test_matcher_runs_when_not_skipped(fake_model: FakeModel) -> None:
+    assert run_nodes({"skip_matcher": False}) == ["tool_matcher", "call_model"]
+    assert fake_model.bound == [["lookup"]]
+
+
+def test_call_model_ignores_stale_matches_when_matcher_off(
+    fake_model: FakeModel,
+) -> None:
+    state = State(messages=[HumanMessage(content="hello")], match_tools=["lookup"])
+    asyncio.run(graph_module.call_model(state, {}, None))
+    assert fake_model.bound == [["lookup", "web_search"]]
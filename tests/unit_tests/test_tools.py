@@ -0,0 +1,165 @@
+import asyncio
+
+import pytest
+
+from react_agent import tools
+
+
+def lookup(query: str) -> str:
+    """Look up a query in a fake MCP server."""
+    return query
+
+
+@pytest.fixture(autouse=True)
+def _isolated_tools_cache(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(tools, "get_runtime", lambda _: None)
+    tools.clear_tools_cache()
+    yield
+    tools.clear_tools_cache()
+
+
+def test_get_tools_shares_single_mcp_fetch(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = 0
+
+    async def fake_get_mcp_tools(server_configs: object) -> list[object]:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        return []
+
+    monkeypatch.setattr(tools, "get_mcp_tools", fake_get_mcp_tools)
+
+    async def run() -> list[list[object]]:
+        return await asyncio.gather(*(tools.get_tools({}) for _ in range(4)))
+
+    results = asyncio.run(run())
+
+    assert calls == 1
+    assert all(result is results[0] for result in results)
+    assert results[0] == [tools.web_search]
+
+
+def test_get_tools_refreshes_after_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = 0
+
+    async def fake_get_mcp_tools(server_configs: object) -> list[object]:
+        nonlocal calls
+        calls += 1
+        return [lookup]
+
+    cleared: list[object] = []
+    monkeypatch.setattr(tools, "get_mcp_tools", fake_get_mcp_tools)
+    monkeypatch.setattr(
+        tools, "clear_mcp_cache", lambda configs=None: cleared.append(configs)
+    )
+    monkeypatch.setattr(tools, "TOOLS_CACHE_TTL", 0.0)
+
+    async def run() -> None:
+        await tools.get_tools({})
+        await tools.get_tools({})
+
+    asyncio.run(run())
+
+    assert calls == 2
+    # The adapter's own cache must be dropped, or it would return stale tools
+    assert len(cleared) == 1 and cleared[0] is not None
+
+
+def test_get_tool_catalog(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def fake_get_mcp_tools(server_configs: object) -> list[object]:
+        return []
+
+    monkeypatch.setattr(tools, "get_mcp_tools", fake_get_mcp_tools)
+
+    catalog = asyncio.run(tools.get_tool_catalog({}))
+
+    assert catalog.tools == [tools.web_search]
+    assert catalog.names == frozenset({"web_search"})
+    assert catalog.description == f"- web_search: {tools.web_search.__doc__}"
+
+
+def test_get_tools_respects_disabled_web_search(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def fake_get_mcp_tools(server_configs: object) -> list[object]:
+        return []
+
+    monkeypatch.setattr(tools, "get_mcp_tools", fake_get_mcp_tools)
+
+    config = {"configurable": {"enable_web_search": False}}
+    assert asyncio.run(tools.get_tools(config)) == []
+
+
+def test_web_search_wraps_single_include_domain(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    keys: list[tuple[object, ...]] = []
+
+    class FakeSearch:
+        async def ainvoke(self, payload: dict[str, str]) -> dict[str, object]:
+            return {"query": payload["query"]}
+
+    def fake_tavily(*key: object) -> FakeSearch:
+        keys.append(key)
+        return FakeSearch()
+
+    monkeypatch.setattr(tools, "_tavily", fake_tavily)
+
+    config = {"configurable": {"max_search_results": 2, "include_domains": "a.com"}}
+    assert asyncio.run(tools.web_search("q", config)) == {"query": "q"}
+    assert keys == [(2, ("a.com",))]
+
+
+def test_get_tools_retries_failed_mcp_fetch(monkeypatch: pytest.MonkeyPatch) -> None:
+    results: list[list[object]] = [[], [lookup]]
+
+    async def fake_get_mcp_tools(server_configs: object) -> list[object]:
+        # The adapter swallows connection errors and returns no tools
+        return results.pop(0)
+
+    monkeypatch.setattr(tools, "get_mcp_tools", fake_get_mcp_tools)
+
+    async def run() -> tuple[list[object], list[object]]:
+        return await tools.get_tools({}), await tools.get_tools({})
+
+    first, second = asyncio.run(run())
+
+    assert first == [tools.web_search]
+    assert second == [tools.web_search, lookup]
+
+
+def test_get_tools_accepts_dict_mcp_configs(monkeypatch: pytest.MonkeyPatch) -> None:
+    received: list[object] = []
+
+    async def fake_get_mcp_tools(server_configs: object) -> list[object]:
+        received.append(server_configs)
+        return [lookup]
+
+    monkeypatch.setattr(tools, "get_mcp_tools", fake_get_mcp_tools)
+
+    servers = {"fake": {"url": "http://localhost/mcp", "transport": "sse"}}
+    config = {"configurable": {"mcp_server_configs": servers}}
+
+    async def run() -> None:
+        await tools.get_tools(config)
+        await tools.get_tools(config)
+
+    asyncio.run(run())
+
+    assert received == [servers]
+
+
+def test_get_tools_drops_expired_catalogs(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def fake_get_mcp_tools(server_configs: object) -> list[object]:
+        return [lookup]
+
+    monkeypatch.setattr(tools, "get_mcp_tools", fake_get_mcp_tools)
+    monkeypatch.setattr(tools, "TOOLS_CACHE_TTL", 0.0)
+
+    async def run() -> None:
+        await tools.get_tools({"configurable": {"enable_web_search": True}})
+        await tools.get_tools({"configurable": {"enable_web_search": False}})
+
+    asyncio.run(run())
+
+    assert [key[1] for key in tools._TOOLS_CACHE] == [False]